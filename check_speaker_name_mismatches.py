@@ -4,93 +4,135 @@ Script to check for name mismatches between speaker JSON files and schedule sess
 This helps identify speakers who might not show up correctly on their profile pages.
 """
 
-import json
+import io
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
 
-def load_json_file(filepath):
-    """Load a JSON file safely."""
+import speaker_data
+
+try:
+    import ijson
+except ImportError:  # Fall back to a full json.load when ijson is unavailable
+    ijson = None
+
+SPEAKERS_JSON = '/Users/zenghaochen/WORKING/GOSIM/hangzhou2025/src/json/Speakers.json'
+SPEAKERS_ZH_JSON = '/Users/zenghaochen/WORKING/GOSIM/hangzhou2025/src/json/SpeakersZh.json'
+SCHEDULE_JSON = '/Users/zenghaochen/WORKING/GOSIM/hangzhou2025/src/json/ScheduleBilingual.json'
+
+def load_schedule_sessions(filepath):
+    """Return the schedule's (category, sessions) pairs as a list.
+
+    With ijson installed only the 'sessions' object is materialized; days,
+    categories and groups are skipped without being built in memory. If the
+    file fails to parse, an empty list is returned rather than the pairs
+    read before the error, matching the json.load fallback.
+    """
+    if ijson is None:
+        schedule = speaker_data.load(filepath)
+        if schedule:
+            return list(schedule.get('sessions', {}).items())
+        return []
+    
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return list(ijson.kvitems(f, 'sessions'))
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
-        return None
+        return []
 
-def extract_speaker_names():
-    """Extract speaker names from both language JSON files."""
-    # Load English speakers
-    speakers_en = load_json_file('/Users/zenghaochen/WORKING/GOSIM/hangzhou2025/src/json/Speakers.json')
-    speakers_zh = load_json_file('/Users/zenghaochen/WORKING/GOSIM/hangzhou2025/src/json/SpeakersZh.json')
-    
+def extract_speaker_names(speakers_en, speakers_zh):
+    """Extract speaker names from both loaded language JSON files."""
     if not speakers_en or not speakers_zh:
         return {}, {}
     
-    # Create ID -> Name mapping for both languages
+    # Create ID -> Name mapping for both languages (IDs are interned because
+    # they key several dicts that are cross-checked against each other)
     en_names = {}
     zh_names = {}
     
     for speaker in speakers_en.get('speakers', []):
-        en_names[speaker['id']] = speaker['name']
+        en_names[sys.intern(speaker['id'])] = speaker['name']
     
     for speaker in speakers_zh.get('speakers', []):
-        zh_names[speaker['id']] = speaker['name']
+        zh_names[sys.intern(speaker['id'])] = speaker['name']
     
     return en_names, zh_names
 
-def extract_schedule_names():
-    """Extract all speaker names from schedule sessions."""
-    schedule = load_json_file('/Users/zenghaochen/WORKING/GOSIM/hangzhou2025/src/json/ScheduleBilingual.json')
-    
-    if not schedule:
-        return {}
-    
-    # Dictionary to store: speaker_id -> {en_name, zh_name, sessions_found_in}
-    schedule_speakers = defaultdict(lambda: {'en_name': None, 'zh_name': None, 'sessions': []})
-    
-    # Go through all sessions
-    for category, sessions in schedule.get('sessions', {}).items():
-        for session in sessions:
-            session_title = session.get('title', 'Unknown Session')
-            if isinstance(session_title, dict):
-                session_title = session_title.get('en', 'Unknown Session')
-            
-            for speaker in session.get('speakers', []):
-                speaker_id = speaker.get('id')
-                if speaker_id:
-                    # Extract names
-                    name = speaker.get('name', {})
-                    if isinstance(name, dict):
-                        en_name = name.get('en')
-                        zh_name = name.get('zh')
-                    else:
-                        en_name = name
-                        zh_name = None
-                    
-                    # Store the names (update if we find more specific info)
-                    if en_name:
-                        schedule_speakers[speaker_id]['en_name'] = en_name
-                    if zh_name:
-                        schedule_speakers[speaker_id]['zh_name'] = zh_name
-                    
-                    # Track which sessions they appear in
-                    schedule_speakers[speaker_id]['sessions'].append(f"{category}: {session_title}")
-    
-    return dict(schedule_speakers)
+def extract_schedule_names(schedule_sessions):
+    """Extract all speaker names from (category, sessions) schedule pairs.
+
+    Returns (en_name_by_id, zh_name_by_id, sessions_by_id) dicts.
+    """
+    # Parallel dicts keyed by speaker_id, so the loop does one lookup per write
+    en_name_by_id = {}
+    zh_name_by_id = {}
+    sessions_by_id = defaultdict(list)
+    
+    # Go through all sessions, flattened to (category, session) pairs
+    category_sessions = chain.from_iterable(
+        zip(repeat(category), sessions) for category, sessions in schedule_sessions
+    )
+    for category, session in category_sessions:
+        # Titles are normally {en, zh} dicts
+        session_title = session.get('title', 'Unknown Session')
+        try:
+            session_title = session_title.get('en', 'Unknown Session')
+        except AttributeError:
+            pass  # Monolingual plain-string title
+        
+        for speaker in session.get('speakers', []):
+            speaker_id = speaker.get('id')
+            if speaker_id:
+                speaker_id = sys.intern(speaker_id)
+                # Extract names (bilingual dict is the common case)
+                name = speaker.get('name')
+                try:
+                    en_name = name.get('en')
+                    zh_name = name.get('zh')
+                except AttributeError:
+                    # Plain-string name, or no name at all
+                    en_name = name
+                    zh_name = None
+                
+                # Store the names (update if we find more specific info)
+                if en_name:
+                    en_name_by_id[speaker_id] = en_name
+                if zh_name:
+                    zh_name_by_id[speaker_id] = zh_name
+                
+                # Track which sessions they appear in (formatted only when reported)
+                sessions_by_id[speaker_id].append((category, session_title))
+    
+    # Every scheduled speaker has an entry in sessions_by_id
+    return en_name_by_id, zh_name_by_id, dict(sessions_by_id)
 
 def find_name_mismatches():
     """Compare speaker names and find potential mismatches."""
     print("🔍 Checking for speaker name mismatches...")
     print("=" * 60)
     
+    # Load the three files concurrently, then extract from the in-memory data
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        en_future = executor.submit(speaker_data.load, SPEAKERS_JSON)
+        zh_future = executor.submit(speaker_data.load, SPEAKERS_ZH_JSON)
+        schedule_future = executor.submit(load_schedule_sessions, SCHEDULE_JSON)
+        speakers_en, speakers_zh = en_future.result(), zh_future.result()
+        schedule_sessions = schedule_future.result()
+    
     # Get all the data
-    en_names, zh_names = extract_speaker_names()
-    schedule_speakers = extract_schedule_names()
+    en_names, zh_names = extract_speaker_names(speakers_en, speakers_zh)
+    schedule_en_names, schedule_zh_names, schedule_sessions_by_id = extract_schedule_names(schedule_sessions)
+    
+    # Buffer the report and write it out in one go instead of per line
+    report = io.StringIO()
     
-    print(f"📊 Summary:")
-    print(f"   - English speakers file: {len(en_names)} speakers")
-    print(f"   - Chinese speakers file: {len(zh_names)} speakers") 
-    print(f"   - Schedule sessions: {len(schedule_speakers)} unique speakers")
-    print()
+    print(f"📊 Summary:", file=report)
+    print(f"   - English speakers file: {len(en_names)} speakers", file=report)
+    print(f"   - Chinese speakers file: {len(zh_names)} speakers", file=report)
+    print(f"   - Schedule sessions: {len(schedule_sessions_by_id)} unique speakers", file=report)
+    print(file=report)
     
     # Find potential issues
     name_mismatches = []
@@ -98,14 +140,14 @@ def find_name_mismatches():
     missing_from_speakers = []
     
     # Check speakers that are in JSON files
-    all_speaker_ids = set(en_names.keys()) | set(zh_names.keys())
+    all_speaker_ids = en_names.keys() | zh_names.keys()
     
     for speaker_id in all_speaker_ids:
         en_speaker_name = en_names.get(speaker_id)
         zh_speaker_name = zh_names.get(speaker_id)
-        schedule_info = schedule_speakers.get(speaker_id)
+        sessions = schedule_sessions_by_id.get(speaker_id)
         
-        if not schedule_info:
+        if not sessions:
             # Speaker exists in JSON but not found in any schedule sessions
             missing_from_schedule.append({
                 'id': speaker_id,
@@ -114,9 +156,12 @@ def find_name_mismatches():
             })
         else:
             # Check for name mismatches
-            schedule_en_name = schedule_info['en_name']
-            schedule_zh_name = schedule_info['zh_name']
+            schedule_en_name = schedule_en_names.get(speaker_id)
+            schedule_zh_name = schedule_zh_names.get(speaker_id)
             
+            # Plain != is enough: str comparison already returns early for the
+            # same object and on a length mismatch, and interning the names
+            # first would cost a hash and compare of its own
             en_mismatch = (en_speaker_name and schedule_en_name and 
                           en_speaker_name != schedule_en_name)
             zh_mismatch = (zh_speaker_name and schedule_zh_name and 
@@ -129,56 +174,57 @@ def find_name_mismatches():
                     'en_schedule': schedule_en_name,
                     'zh_json': zh_speaker_name,
                     'zh_schedule': schedule_zh_name,
-                    'sessions': schedule_info['sessions']
+                    'sessions': sessions
                 })
     
     # Check speakers that are in schedule but not in JSON files
-    for speaker_id in schedule_speakers:
-        if speaker_id not in all_speaker_ids:
-            schedule_info = schedule_speakers[speaker_id]
-            missing_from_speakers.append({
-                'id': speaker_id,
-                'en_name': schedule_info['en_name'],
-                'zh_name': schedule_info['zh_name'],
-                'sessions': schedule_info['sessions']
-            })
+    # (sorted, so the report is stable across runs despite hash randomization)
+    for speaker_id in sorted(schedule_sessions_by_id.keys() - all_speaker_ids):
+        missing_from_speakers.append({
+            'id': speaker_id,
+            'en_name': schedule_en_names.get(speaker_id),
+            'zh_name': schedule_zh_names.get(speaker_id),
+            'sessions': schedule_sessions_by_id[speaker_id]
+        })
     
     # Report findings
-    print("🚨 NAME MISMATCHES (could cause session display issues):")
-    print("-" * 60)
+    print("🚨 NAME MISMATCHES (could cause session display issues):", file=report)
+    print("-" * 60, file=report)
     if name_mismatches:
         for mismatch in name_mismatches:
-            print(f"ID: {mismatch['id']}")
-            print(f"   📝 English: JSON='{mismatch['en_json']}' vs Schedule='{mismatch['en_schedule']}'")
-            print(f"   📝 Chinese: JSON='{mismatch['zh_json']}' vs Schedule='{mismatch['zh_schedule']}'")
-            print(f"   📅 Sessions: {len(mismatch['sessions'])}")
-            for session in mismatch['sessions'][:2]:  # Show first 2 sessions
-                print(f"      • {session}")
+            print(f"ID: {mismatch['id']}", file=report)
+            print(f"   📝 English: JSON='{mismatch['en_json']}' vs Schedule='{mismatch['en_schedule']}'", file=report)
+            print(f"   📝 Chinese: JSON='{mismatch['zh_json']}' vs Schedule='{mismatch['zh_schedule']}'", file=report)
+            print(f"   📅 Sessions: {len(mismatch['sessions'])}", file=report)
+            for category, session_title in mismatch['sessions'][:2]:  # Show first 2 sessions
+                print(f"      • {category}: {session_title}", file=report)
             if len(mismatch['sessions']) > 2:
-                print(f"      ... and {len(mismatch['sessions']) - 2} more")
-            print()
+                print(f"      ... and {len(mismatch['sessions']) - 2} more", file=report)
+            print(file=report)
     else:
-        print("✅ No name mismatches found!")
+        print("✅ No name mismatches found!", file=report)
     
-    print(f"⚠️  SPEAKERS IN JSON BUT NOT IN SCHEDULE ({len(missing_from_schedule)}):")
-    print("-" * 60)
+    print(f"⚠️  SPEAKERS IN JSON BUT NOT IN SCHEDULE ({len(missing_from_schedule)}):", file=report)
+    print("-" * 60, file=report)
     if missing_from_schedule:
         for speaker in missing_from_schedule[:10]:  # Show first 10
-            print(f"   • {speaker['id']} ({speaker['en_name']} / {speaker['zh_name']})")
+            print(f"   • {speaker['id']} ({speaker['en_name']} / {speaker['zh_name']})", file=report)
         if len(missing_from_schedule) > 10:
-            print(f"   ... and {len(missing_from_schedule) - 10} more")
+            print(f"   ... and {len(missing_from_schedule) - 10} more", file=report)
     else:
-        print("✅ All speakers in JSON files are found in schedule!")
+        print("✅ All speakers in JSON files are found in schedule!", file=report)
     
-    print()
-    print(f"❓ SPEAKERS IN SCHEDULE BUT NOT IN JSON ({len(missing_from_speakers)}):")
-    print("-" * 60)
+    print(file=report)
+    print(f"❓ SPEAKERS IN SCHEDULE BUT NOT IN JSON ({len(missing_from_speakers)}):", file=report)
+    print("-" * 60, file=report)
     if missing_from_speakers:
         for speaker in missing_from_speakers:
-            print(f"   • {speaker['id']} ({speaker['en_name']} / {speaker['zh_name']})")
-            print(f"     Sessions: {len(speaker['sessions'])}")
+            print(f"   • {speaker['id']} ({speaker['en_name']} / {speaker['zh_name']})", file=report)
+            print(f"     Sessions: {len(speaker['sessions'])}", file=report)
     else:
-        print("✅ All schedule speakers are found in JSON files!")
+        print("✅ All schedule speakers are found in JSON files!", file=report)
+    
+    sys.stdout.write(report.getvalue())
     
     return {
         'name_mismatches': name_mismatches,
@@ -0,0 +1,87 @@
+"""
+Shared JSON loading for the speaker maintenance scripts.
+
+Parsed files are cached on disk as pickles (reused across runs while the
+source file is unchanged) and in-process, so scripts that import this module
+parse each file at most once.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json parser
+    orjson = None
+
+# Parsed JSON is pickled here and reused until the source file changes
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'paris2026')
+
+def _parse_json_file(filepath):
+    """Parse a JSON file, raising on any read or decode error."""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def read_json_cached(filepath):
+    """Load a JSON file, reusing a pickled copy while it is unchanged.
+
+    Each source file has one cache entry, stamped with its mtime and size.
+    Read and parse errors propagate to the caller.
+    """
+    st = os.stat(filepath)
+    stamp = (st.st_mtime_ns, st.st_size)
+    path_key = hashlib.sha1(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{path_key}.pickle")
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except Exception:
+        pass  # Missing, stale or unreadable cache entry; reparse below
+    
+    data = _parse_json_file(filepath)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, delete=False) as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+    return data
+
+# In-process cache: path -> ((mtime_ns, size), data), one entry per path so a
+# rewritten file replaces its old parsed copy instead of adding another
+_loaded = {}
+
+def read(filepath):
+    """Load a JSON file once per process while it is unchanged.
+
+    Errors propagate (and are not cached), so scripts that write the data
+    fail loudly. The returned object is shared between callers and must not
+    be mutated.
+    """
+    st = os.stat(filepath)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _loaded.get(filepath)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    data = read_json_cached(filepath)
+    _loaded[filepath] = (stamp, data)
+    return data
+
+def load(filepath):
+    """Like read(), but print the error and return None on failure."""
+    try:
+        return read(filepath)
+    except Exception as e:
+        print(f"Error loading {filepath}: {e}")
+        return None
@@ -13,166 +13,120 @@ Tag Rules:
 - Speakers in multiple events get all corresponding tags
 """
 
-def create_speaker_event_mapping():
-    """Create a mapping of speaker IDs to their event tags."""
-
-    # Initialize the mapping dictionary
-    speaker_tags = {}
-
-    # Helper function to add tags for speakers
-    def add_speaker_tags(speakers, tag):
-        for speaker in speakers:
-            speaker = speaker.strip()
-            if speaker not in speaker_tags:
-                speaker_tags[speaker] = []
-            if tag not in speaker_tags[speaker]:
-                speaker_tags[speaker].append(tag)
+import functools
+import sys
+from collections import defaultdict
+from types import MappingProxyType
 
+# Event tag -> IDs of the speakers participating in that track or event
+TAG_TO_SPEAKERS = {
     # Main Conference Tracks
     # Plenary track
-    plenary_speakers = [
+    "plenary": (
         "tao-jiang", "mehdi-snene", "bill-ren", "michael-yuan",
-        "yonghua-lin", "li-jianzhong"
-    ]
-    add_speaker_tags(plenary_speakers, "plenary")
-
+        "yonghua-lin", "li-jianzhong",
+    ),
     # AI Models & Infrastructure track
-    ai_models_infra_speakers = [
+    "ai-models-infra": (
         "guang-liu", "krzysztof-ociepa", "markus-tavenrath", "yuxuan-zhang",
         "speaker-zhu-de-jiang", "zhang-yubo", "chen-zicong", "speaker-chen-hai-quan",
         "speaker-ding-yi-bin", "aurlienmorgan-claudon", "speaker-he-wan-qing",
         "kaichao-you", "jingdong-chen", "vincent-caldeira", "speaker-wang-tian-ce",
-        "paul-yang", "zhang-renwei", "xuan-son-nguyen", "richard-reiner", "jingya-huang"
-    ]
-    add_speaker_tags(ai_models_infra_speakers, "ai-models-infra")
-
+        "paul-yang", "zhang-renwei", "xuan-son-nguyen", "richard-reiner", "jingya-huang",
+    ),
     # Embodied AI track
-    embodied_ai_speakers = [
+    "embodied-ai": (
         "satya-mallick", "xueqin-dong", "edgar-riba", "mashengyue", "speaker-yin-yun-peng",
         "jinwei-gu", "speaker-wang-peng-wei", "xuan-xia", "cen-ming", "yu-huang",
-        "xavier-tao", "tao-li", "martino-russi", "yuyuan-yuan", "jian-shi", "yongsen-mao"
-    ]
-    add_speaker_tags(embodied_ai_speakers, "embodied-ai")
-
+        "xavier-tao", "tao-li", "martino-russi", "yuyuan-yuan", "jian-shi", "yongsen-mao",
+    ),
     # Agentic Web track
-    agentic_web_speakers = [
+    "agentic-web": (
         "philippe-le-hegaret", "speaker-chang-gao-wei", "manuel-rego", "speaker-zhang-yun-fei",
         "joaquin-salvachua", "jennie-shi", "jesse-ezell", "zhigang-sun", "drummond-reed",
         "markus-sabadello", "chunhui-mo", "wenjing-chu", "jos-andrs-muoz-arcentales",
-        "robin-shang", "martin-alvarez-espinar", "guangzhen-li"
-    ]
-    add_speaker_tags(agentic_web_speakers, "agentic-web")
-
+        "robin-shang", "martin-alvarez-espinar", "guangzhen-li",
+    ),
     # Apps & Agents track
-    apps_agents_speakers = [
+    "apps-agents": (
         "speaker-wang-xin-meng", "speaker-di-ji-dong", "zhuo-wu", "wilson-wang",
         "yin-zhenxi", "shuangrui-chen", "hugejile", "evan-fannin", "yanzhi-wang",
         "speaker-liu-nan-bing", "speaker-han-hong-ying", "speaker-bai-ting",
         "xiang-ying", "sizhe-cheng", "alexy-khrabrov-", "zhao-weiqi", "zhiyu-li",
-        "abdallah-essa", "dandjinou-charbel"
-    ]
-    add_speaker_tags(apps_agents_speakers, "apps-agents")
-
+        "abdallah-essa", "dandjinou-charbel",
+    ),
     # AI Next track
-    ai_next_speakers = [
+    "ai-next": (
         "wang-jialiang", "speaker-wei-wei", "alexandra-boucherifi", "yichuan-yue",
         "huixin-xue", "jixun-yao", "zhenghao-chen", "salim-nahle", "wei-wang",
         "karol-stryja", "katarzyna-z-staroslawska", "speaker-shi-zhong-zhi", "nicolas-flores-herr", "jingbin-zhang",
-        "kai-du", "qian-zheng", "hu-he", "speaker-zhang-quan-shi", "shiwei-liu"
-    ]
-    add_speaker_tags(ai_next_speakers, "ai-next")
-
+        "kai-du", "qian-zheng", "hu-he", "speaker-zhang-quan-shi", "shiwei-liu",
+    ),
     # Workshops
     # SGLang Workshop
-    ws_sglang_speakers = [
+    "ws-sglang": (
         "yi-zhang", "shangming-cai-", "yanbo-yang", "junrong-lin", "yikai-zhu",
-        "chao-wang", "yizhong-cao-", "xiaoming-bao", "speaker-wang-dong", "xiaolei-zhang"
-    ]
-    add_speaker_tags(ws_sglang_speakers, "ws-sglang")
-
+        "chao-wang", "yizhong-cao-", "xiaoming-bao", "speaker-wang-dong", "xiaolei-zhang",
+    ),
     # Cangjie Workshop
-    ws_cangjie_speakers = [
+    "ws-cangjie": (
         "speaker-wang-xue-zhi", "speaker-zhao-dong", "speaker-pan-wan-kun",
         "speaker-zhang-yin", "wang-jianfeng", "speaker-chen-yu-long",
-        "speaker-wu-jing-run", "speaker-zhang-hao-yang"
-    ]
-    add_speaker_tags(ws_cangjie_speakers, "ws-cangjie")
-
+        "speaker-wu-jing-run", "speaker-zhang-hao-yang",
+    ),
     # Dora Workshop
-    ws_dora_speakers = [
+    "ws-dora": (
         "ruping-cen", "yang-li", "yiming-zhang", "baorui-lv", "tao-li",
-        "xiang-yang", "hu-youhao", "zhongjin-lu", "yijun-chen", "gege-wang", "bob-ding"
-    ]
-    add_speaker_tags(ws_dora_speakers, "ws-dora")
-
+        "xiang-yang", "hu-youhao", "zhongjin-lu", "yijun-chen", "gege-wang", "bob-ding",
+    ),
     # Future Web Workshop
-    ws_future_web_speakers = [
+    "ws-future-web": (
         "ming-fu", "martin-robinson", "gregory-terzian", "jing-zhang",
-        "zhizhen-ye", "jingshi-shangguan", "philippe-le-hegaret"
-    ]
-    add_speaker_tags(ws_future_web_speakers, "ws-future-web")
-
+        "zhizhen-ye", "jingshi-shangguan", "philippe-le-hegaret",
+    ),
     # Edge AI Workshop
-    ws_edge_ai_speakers = [
+    "ws-edge-ai": (
         "mats-lundgren", "zhuo-wu", "xuan-son-nguyen", "yanzhi-wang",
-        "jingyua-huang", "weiyu-xie", "sebastien-crozet", "yue-bao", "markus-tavenrath"
-    ]
-    add_speaker_tags(ws_edge_ai_speakers, "ws-edge-ai")
-
+        "jingyua-huang", "weiyu-xie", "sebastien-crozet", "yue-bao", "markus-tavenrath",
+    ),
     # CANN Workshop
-    ws_cann_speakers = [
-        "xiaolei-wang", "xu-han", "su-tong-hua", "jinxiang-wang"
-    ]
-    add_speaker_tags(ws_cann_speakers, "ws-cann")
-
+    "ws-cann": (
+        "xiaolei-wang", "xu-han", "su-tong-hua", "jinxiang-wang",
+    ),
     # AI Education Workshop
-    ws_ai_education_speakers = [
+    "ws-ai-education": (
         "yuegang-liu", "yuqing-yan", "maohua-zhou", "weidong-shao", "zhigang-sun",
-        "haiyang-xin", "yan-feng", "yanzhi-wang", "yonghui-wu"
-    ]
-    add_speaker_tags(ws_ai_education_speakers, "ws-ai-education")
-
+        "haiyang-xin", "yan-feng", "yanzhi-wang", "yonghui-wu",
+    ),
     # Embedded Rust Workshop
-    ws_embedded_rust_speakers = [
-        "rik-arends", "sebastian-michailidis"
-    ]
-    add_speaker_tags(ws_embedded_rust_speakers, "ws-embedded-rust")
-
+    "ws-embedded-rust": (
+        "rik-arends", "sebastian-michailidis",
+    ),
     # Flutter Meetup
-    ws_flutter_speakers = [
-        "jesse-ezell", "matt-carroll"
-    ]
-    add_speaker_tags(ws_flutter_speakers, "ws-flutter")
-
+    "ws-flutter": (
+        "jesse-ezell", "matt-carroll",
+    ),
     # React Native Workshop
-    ws_rn_speakers = [
-        "michal-pierzchala", "oskar-kwasniewski"
-    ]
-    add_speaker_tags(ws_rn_speakers, "ws-rn")
-
+    "ws-rn": (
+        "michal-pierzchala", "oskar-kwasniewski",
+    ),
     # ChiTu Workshop
-    ws_chitu_speakers = [
+    "ws-chitu": (
         "speaker-he-wan-qing", "shizhi-tang", "runqing-zhang", "jian-li",
-        "ji-li", "tongyu-guo", "zhixing-li", "zhibin-jia", "xiaowei-shen"
-    ]
-    add_speaker_tags(ws_chitu_speakers, "ws-chitu")
-
+        "ji-li", "tongyu-guo", "zhixing-li", "zhibin-jia", "xiaowei-shen",
+    ),
     # Solana Workshop
-    ws_solana_speakers = [
-        "mike-ma-solana"
-    ]
-    add_speaker_tags(ws_solana_speakers, "ws-solana")
-
+    "ws-solana": (
+        "mike-ma-solana",
+    ),
     # Globalization Workshop
-    ws_globalization_speakers = [
+    "ws-globalization": (
         "guofeng-zhang", "william-guo", "richard-lin", "adina-yakefu",
-        "michael-yuan", "qin-wang"
-    ]
-    add_speaker_tags(ws_globalization_speakers, "ws-globalization")
-
+        "michael-yuan", "qin-wang",
+    ),
     # Co-located Events
     # AI Vision Forum
-    forum_aivision_speakers = [
+    "forum-aivision": (
         "tao-jiang", "salim-nahle", "vivian-cai", "wei-wang", "bella-ren",
         "zheng-haoyun", "yuegang-liu", "zhigang-sun", "yuqing-yan", "wang-juchen",
         "alexandra-boucherifi", "yan-feng", "speaker-wei-wei", "maohua-zhou",
@@ -181,59 +135,57 @@ def create_speaker_event_mapping():
         "cailean-osborne", "jesse-mccrosky", "xiaohu-zhu", "christian-maitre",
         "wu-shaoqing", "abdallah-essa", "emily-chen", "mehdi-snene", "sameer-chauhan",
         "emily-bennett", "carlos-correia", "yonghua-lin", "qin-wang", "richard-bian",
-        "piao-yishi", "bill-ren"
-    ]
-    add_speaker_tags(forum_aivision_speakers, "forum-aivision")
-
+        "piao-yishi", "bill-ren",
+    ),
     # Open for SDG
-    open_for_sdg_speakers = [
+    "open-for-sdg": (
         "tiejun-huang", "mehdi-snene", "yonghua-lin", "nicolas-flores-herr",
         "joaquin-salvachua", "johann-diedrick", "richard-bian", "yong-qin",
         "bangxu-yu", "xinwei-hu", "anni-lai", "nooman-fehri", "vincent-caldeira",
         "matt-white", "liyun-yang", "alex-zhu", "alexy-khrabrov-", "minghui-zhou",
         "mohamed-farahat", "walid-mathlouthi", "yao-chen", "bryan-che", "kai-du",
-        "satya-mallick", "yin-peng"
-    ]
-    add_speaker_tags(open_for_sdg_speakers, "open-for-sdg")
-
+        "satya-mallick", "yin-peng",
+    ),
     # Rust China Conference (all rust-china events use "rustchinaconf" tag)
     # Rust China Plenary
-    rust_china_plenary_speakers = [
+    "rustchinaconf": (
         "mike-tang", "rebecca-rumbul", "meng-ke", "yizhou-lu", "jack-huey",
         "josh-triplett", "miguel-ojeda", "yongyi-yu", "rolland-dudemaine",
-        "sebastien-crozet", "yu-chen", "michael-yuan"
-    ]
-    add_speaker_tags(rust_china_plenary_speakers, "rustchinaconf")
-
-    # Rust China Track 1
-    rust_china_1_speakers = [
+        "sebastien-crozet", "yu-chen", "michael-yuan",
+        # Rust China Track 1
         "james-munns", "adam-harvey", "zili-chen", "jindi-shen", "dean-little",
         "haobo-gu", "zhenchi-zhong", "hongbo-zhang", "yubin-zhao", "xiaoyu-chen",
-        "xuecheng-yang", "zan-pan"
-    ]
-    add_speaker_tags(rust_china_1_speakers, "rustchinaconf")
-
-    # Rust China Track 2
-    rust_china_2_speakers = [
+        "xuecheng-yang", "zan-pan",
+        # Rust China Track 2
         "esteban-kuber", "jonathan-kelly", "isacc-zhang", "orhun-parmaksiz",
         "alejandra-gonzalez", "yuan-li", "jiayan-wu", "bohao-tang", "kevin-boos",
-        "guillaume-gomez", "david-lattimore", "qiqi-zhang", "xudong-huang", "jiping-zhou"
-    ]
-    add_speaker_tags(rust_china_2_speakers, "rustchinaconf")
-
-    # Rust China Track 3
-    rust_china_3_speakers = [
+        "guillaume-gomez", "david-lattimore", "qiqi-zhang", "xudong-huang", "jiping-zhou",
+        # Rust China Track 3
         "hongliang-tian", "bart-massey", "li-zhang", "rik-arends", "han-jiang",
         "hui-ding", "manuel-drehwald", "zhifeng-sun", "xuewo-ding", "yifei-sheng",
-        "lio-qing", "archer-aimo", "yuxiao-wang", "mingxuan-liu"
-    ]
-    add_speaker_tags(rust_china_3_speakers, "rustchinaconf")
+        "lio-qing", "archer-aimo", "yuxiao-wang", "mingxuan-liu",
+    ),
+}
 
-    # Sort tags for each speaker for consistency
-    for speaker in speaker_tags:
-        speaker_tags[speaker].sort()
 
-    return speaker_tags
+@functools.lru_cache(maxsize=1)
+def create_speaker_event_mapping():
+    """Create a mapping of speaker IDs to their event tags.
+
+    The result is cached and read-only: tags are sorted tuples behind a
+    MappingProxyType, so callers must copy before mutating.
+    """
+
+    # Collect tags per speaker (sets dedupe speakers listed under several tracks)
+    speaker_tags = defaultdict(set)
+    for tag, speakers in TAG_TO_SPEAKERS.items():
+        for speaker in speakers:
+            speaker_tags[sys.intern(speaker.strip())].add(tag)
+
+    # Sort tags for each speaker for consistency
+    return MappingProxyType(
+        {speaker: tuple(sorted(tags)) for speaker, tags in speaker_tags.items()}
+    )
 
 
 def main():
@@ -259,9 +211,11 @@ def main():
     print("=" * 50)
 
     # Sort speakers alphabetically for better readability
-    for speaker in sorted(speaker_mapping.keys()):
-        tags = speaker_mapping[speaker]
-        print(f"'{speaker}': {tags}")
+    # (joined into a single write rather than one print per speaker)
+    print("\n".join(
+        f"'{speaker}': {list(speaker_mapping[speaker])}"
+        for speaker in sorted(speaker_mapping.keys())
+    ))
 
     print("\n" + "=" * 50)
     print("Mapping generation complete!")
@@ -6,47 +6,110 @@ based on their event attendance.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+import speaker_data
 from speaker_event_mapping import create_speaker_event_mapping
 
-def update_speaker_tags(json_file_path, speaker_mapping):
-    """Update tags for speakers in the JSON file."""
-    # Read the current JSON file
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json encoder/decoder
+    orjson = None
+
+# Category/tag IDs that may appear in the speakers list but are not speakers
+_VALID_TAG_IDS = frozenset({
+    'all', 'plenary', 'ai-models-infra', 'embodied-ai',
+    'agentic-web', 'apps-agents', 'ai-next', 'ws-sglang',
+    'ws-cangjie', 'ws-dora', 'ws-future-web', 'ws-edge-ai',
+    'ws-cann', 'ws-flutter', 'ws-chitu', 'ws-ai-education',
+    'ws-rn', 'ws-rust', 'ws-makepad', 'ws-embedded-rust',
+    'ws-solana', 'ws-globalization', 'open-for-sdg',
+    'forum-aivision', 'rustchinaconf',
+})
+
+def compute_speaker_tag_updates(json_file_path, speaker_mapping, log=print):
+    """Work out the tag changes for the JSON file without writing it.
+
+    ``speaker_mapping`` maps speaker IDs to sorted tag sequences, as returned
+    by create_speaker_event_mapping(). Per-speaker messages go through ``log``
+    so parallel runs can buffer them. Returns (updated_count,
+    speakers_not_in_mapping, payload), where payload is the encoded file
+    contents, or None when nothing changed.
+    """
+    # Read the current JSON file (shared with the checker script, so it is
+    # never mutated; changed speakers are copied when encoding below). Load
+    # errors are raised rather than reported, since this script writes the data
+    data = speaker_data.read(json_file_path)
     
-    # Track speakers that were updated and speakers not found in mapping
-    updated_count = 0
-    speakers_not_in_mapping = []
+    # Track new tags by speaker index and speakers not found in mapping
+    updated_tags = {}
+    speakers_not_in_mapping = set()
     
     # Update each speaker's tags
-    for speaker in data.get('speakers', []):
+    for index, speaker in enumerate(data.get('speakers', [])):
         speaker_id = speaker.get('id', '')
         
         if speaker_id in speaker_mapping:
             # Update tags based on event attendance
-            new_tags = speaker_mapping[speaker_id]
+            # Mapping tags are already sorted, so only old_tags needs sorting
+            new_tags = tuple(speaker_mapping[speaker_id])
             old_tags = speaker.get('tags', [])
             
             # Only update if tags are different
-            if sorted(old_tags) != sorted(new_tags):
-                speaker['tags'] = new_tags
-                updated_count += 1
-                print(f"Updated {speaker_id}: {old_tags} → {new_tags}")
+            if tuple(sorted(old_tags)) != new_tags:
+                new_tags = list(new_tags)
+                updated_tags[index] = new_tags
+                log(f"Updated {speaker_id}: {old_tags} → {new_tags}")
         else:
             # This speaker is not attending any events
-            if speaker_id not in ['all', 'plenary', 'ai-models-infra', 'embodied-ai', 
-                                 'agentic-web', 'apps-agents', 'ai-next', 'ws-sglang', 
-                                 'ws-cangjie', 'ws-dora', 'ws-future-web', 'ws-edge-ai', 
-                                 'ws-cann', 'ws-flutter', 'ws-chitu', 'ws-ai-education', 
-                                 'ws-rn', 'ws-rust', 'ws-makepad', 'ws-embedded-rust', 
-                                 'ws-solana', 'ws-globalization', 'open-for-sdg', 
-                                 'forum-aivision', 'rustchinaconf']:
-                speakers_not_in_mapping.append(speaker_id)
+            if speaker_id not in _VALID_TAG_IDS:
+                speakers_not_in_mapping.add(speaker_id)
     
-    # Write the updated JSON back to file
-    with open(json_file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Nothing changed, so the file does not need rewriting
+    updated_count = len(updated_tags)
+    if updated_count == 0:
+        return 0, speakers_not_in_mapping, None
+    
+    data = {**data, 'speakers': [
+        dict(speaker, tags=updated_tags[index]) if index in updated_tags else speaker
+        for index, speaker in enumerate(data['speakers'])
+    ]}
+    
+    # orjson emits UTF-8 and the same 2-space layout as
+    # json.dump(indent=2, ensure_ascii=False)
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
     
+    return updated_count, speakers_not_in_mapping, payload
+
+def write_json_payload(json_file_path, payload):
+    """Write encoded JSON to a temp file and swap it in atomically.
+
+    Readers never see a half-written file. A plain open() (rather than
+    NamedTemporaryFile) keeps the JSON file's usual permissions; the temp
+    file is removed if anything fails.
+    """
+    tmp_path = json_file_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, json_file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def update_speaker_tags(json_file_path, speaker_mapping, log=print):
+    """Update tags for speakers in the JSON file.
+
+    ``speaker_mapping`` maps speaker IDs to sorted tag sequences, as returned
+    by create_speaker_event_mapping().
+    """
+    updated_count, speakers_not_in_mapping, payload = compute_speaker_tag_updates(
+        json_file_path, speaker_mapping, log)
+    if payload is not None:
+        write_json_payload(json_file_path, payload)
     return updated_count, speakers_not_in_mapping
 
 def main():
@@ -57,16 +120,31 @@ def main():
     speakers_json = '/Users/zenghaochen/WORKING/GOSIM/hangzhou2025/src/json/Speakers.json'
     speakers_zh_json = '/Users/zenghaochen/WORKING/GOSIM/hangzhou2025/src/json/SpeakersZh.json'
     
-    print("Updating Speakers.json...")
-    updated_count_en, not_found_en = update_speaker_tags(speakers_json, speaker_mapping)
-    print(f"Updated {updated_count_en} speakers in Speakers.json")
-    
-    print("\nUpdating SpeakersZh.json...")
-    updated_count_zh, not_found_zh = update_speaker_tags(speakers_zh_json, speaker_mapping)
-    print(f"Updated {updated_count_zh} speakers in SpeakersZh.json")
+    # Both files are independent read/parse/encode jobs, so run them together.
+    # Writes happen here in file order once each job has succeeded, so a
+    # failure stops before any later file is touched, as in a sequential run
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        jobs = []
+        for json_path in (speakers_json, speakers_zh_json):
+            messages = []
+            future = executor.submit(compute_speaker_tag_updates, json_path, speaker_mapping, messages.append)
+            jobs.append((json_path, messages, future))
+        
+        all_not_found = set()
+        for i, (json_path, messages, future) in enumerate(jobs):
+            filename = os.path.basename(json_path)
+            if i:
+                print()
+            print(f"Updating {filename}...", flush=True)
+            updated_count, not_found, payload = future.result()
+            for message in messages:
+                print(message)
+            if payload is not None:
+                write_json_payload(json_path, payload)
+            print(f"Updated {updated_count} speakers in {filename}")
+            all_not_found |= not_found
     
     # Report speakers not attending any sessions
-    all_not_found = set(not_found_en + not_found_zh)
     if all_not_found:
         print(f"\n⚠️  Speakers not attending any sessions ({len(all_not_found)}):")
         for speaker in sorted(all_not_found):